@@ -1,19 +1,22 @@
-from datetime import datetime
+from dataclasses import dataclass, field
 from typing import Dict, Optional
-from pydantic import BaseModel, Field
 
 
-class ContentItem(BaseModel):
+@dataclass(slots=True)
+class ContentItem:
     """Base model for collected content items."""
 
-    source: str = Field(..., description="Source type (rss, web)")
-    content: str = Field(..., description="Content text")
-    url: str = Field(..., description="Content URL")
-    title: str = Field(
-        "", description="Content title"
-    )  # Empty string default instead of None
-    date: Optional[str] = Field(None, description="Publication date")
-    metadata: Dict = Field(default_factory=dict, description="Additional metadata")
+    source: str  # Source type (rss, web)
+    content: str  # Content text
+    url: str  # Content URL
+    title: str = ""  # Empty string default instead of None
+    date: Optional[str] = None  # Publication date
+    metadata: Dict = field(default_factory=dict)  # Additional metadata
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.strftime("%Y-%m-%d %H:%M:%S UTC")}
+    # Truncated content shared by the LLM processors, computed once
+    validation_excerpt: str = field(init=False, default="")
+    summary_excerpt: str = field(init=False, default="")
+
+    def __post_init__(self):
+        self.validation_excerpt = self.content[:200].strip()
+        self.summary_excerpt = self.content[:2500]
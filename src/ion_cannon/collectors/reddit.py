@@ -1,14 +1,42 @@
+import asyncio
 import logging
+import re
 from typing import List
 import asyncpraw
 import aiohttp
-from bs4 import BeautifulSoup
+import lxml.html
 from datetime import datetime, timezone
 from ion_cannon.collectors.base import ContentItem
 from ion_cannon.config.settings import settings
+from ion_cannon.core.keywords import find_keyword
+from ion_cannon.utils.seen_urls import SeenUrlStore
 
 logger = logging.getLogger("ion_cannon")
 
+_WS_RE = re.compile(r"\s+")
+
+# Content types that never contain extractable page text
+_NON_HTML_CONTENT_TYPES = ("image/", "video/", "audio/", "application/pdf")
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Resolved once at import rather than on every fetched URL
+_MAX_CONTENT_LENGTH = getattr(settings, "MAX_CONTENT_LENGTH", None)
+_MAX_FETCH_BYTES = (
+    _MAX_CONTENT_LENGTH * 4 if _MAX_CONTENT_LENGTH else settings.FETCH_MAX_BYTES
+)
+
+
+async def _read_capped(response: aiohttp.ClientResponse, max_bytes: int) -> bytes:
+    """
+    Read the response body in chunks, stopping once max_bytes have been read
+    """
+    body = bytearray()
+    async for chunk in response.content.iter_chunked(_READ_CHUNK_SIZE):
+        body.extend(chunk)
+        if len(body) >= max_bytes:
+            break
+    return bytes(body)
+
 
 async def fetch_url_content(session: aiohttp.ClientSession, url: str) -> str:
     """
@@ -18,41 +46,44 @@ async def fetch_url_content(session: aiohttp.ClientSession, url: str) -> str:
     try:
         async with session.get(url, timeout=30) as response:
             if response.status == 200:
-                logger.debug(f"Successfully fetched URL: {url}")
-                html = await response.text()
-                soup = BeautifulSoup(html, "html.parser")
-
-                # Remove script and style elements
-                for script in soup(["script", "style"]):
-                    script.decompose()
+                logger.debug("Successfully fetched URL: %s", url)
+                content_type = response.headers.get("Content-Type", "").lower()
+                if content_type.startswith(_NON_HTML_CONTENT_TYPES):
+                    logger.debug(
+                        "Skipping non-HTML content (%s): %s", content_type, url
+                    )
+                    return ""
 
-                # Get text content
-                text = soup.get_text(separator=" ", strip=True)
+                # Only read as much of the page as could survive truncation
+                body = await _read_capped(response, _MAX_FETCH_BYTES)
 
-                # Clean up whitespace
-                lines = (line.strip() for line in text.splitlines())
-                chunks = (
-                    phrase.strip() for line in lines for phrase in line.split("  ")
+                # Let lxml sniff the encoding when the server doesn't declare one
+                parser = (
+                    lxml.html.HTMLParser(encoding=response.charset)
+                    if response.charset
+                    else None
                 )
-                text = " ".join(chunk for chunk in chunks if chunk)
+                doc = lxml.html.fromstring(body, parser=parser)
+
+                # Remove script and style elements
+                for element in doc.xpath("//script|//style"):
+                    element.drop_tree()
+
+                # Get text content and collapse whitespace
+                text = _WS_RE.sub(" ", " ".join(doc.itertext())).strip()
 
                 content_length = len(text)
                 logger.info(f"Extracted {content_length} characters from {url}")
 
-                final_text = (
-                    text[: settings.MAX_CONTENT_LENGTH]
-                    if hasattr(settings, "MAX_CONTENT_LENGTH")
-                    else text
-                )
-                if (
-                    hasattr(settings, "MAX_CONTENT_LENGTH")
-                    and content_length > settings.MAX_CONTENT_LENGTH
-                ):
+                if _MAX_CONTENT_LENGTH and content_length > _MAX_CONTENT_LENGTH:
                     logger.debug(
-                        f"Content truncated from {content_length} to {settings.MAX_CONTENT_LENGTH} characters"
+                        "Content truncated from %d to %d characters",
+                        content_length,
+                        _MAX_CONTENT_LENGTH,
                     )
+                    return text[:_MAX_CONTENT_LENGTH]
 
-                return final_text
+                return text
             else:
                 logger.warning(
                     f"Failed to fetch URL {url}, status code: {response.status}"
@@ -72,7 +103,7 @@ async def get_post_content(post, session: aiohttp.ClientSession) -> str:
 
     # Get post's selftext if it exists
     if hasattr(post, "selftext") and post.selftext:
-        logger.debug(f"Found selftext content of length: {len(post.selftext)}")
+        logger.debug("Found selftext content of length: %d", len(post.selftext))
         content_parts.append(post.selftext)
     else:
         logger.debug("No selftext content found in post")
@@ -80,7 +111,7 @@ async def get_post_content(post, session: aiohttp.ClientSession) -> str:
     # If the post has a URL that's not a Reddit link, fetch its content
     if hasattr(post, "url") and post.url:
         url = post.url
-        logger.debug(f"Post URL found: {url}")
+        logger.debug("Post URL found: %s", url)
         if not url.startswith("https://reddit.com") and not url.startswith(
             "https://www.reddit.com"
         ):
@@ -88,7 +119,8 @@ async def get_post_content(post, session: aiohttp.ClientSession) -> str:
             url_content = await fetch_url_content(session, url)
             if url_content:
                 logger.debug(
-                    f"Successfully fetched external content of length: {len(url_content)}"
+                    "Successfully fetched external content of length: %d",
+                    len(url_content),
                 )
                 content_parts.append(url_content)
             else:
@@ -101,7 +133,7 @@ async def get_post_content(post, session: aiohttp.ClientSession) -> str:
     return final_content
 
 
-async def collect_reddit() -> List[ContentItem]:
+async def collect_reddit(session: aiohttp.ClientSession) -> List[ContentItem]:
     logger.info("Starting Reddit content collection")
     reddit = asyncpraw.Reddit(
         client_id=settings.REDDIT_CLIENT_ID,
@@ -110,66 +142,88 @@ async def collect_reddit() -> List[ContentItem]:
     )
 
     items = []
-    keywords = [keyword.lower() for keyword in settings.KEYWORDS]
-    logger.info(f"Searching for keywords: {keywords}")
-    logger.info(f"Searching in subreddits: {settings.REDDIT_CHANNELS}")
-
-    async with aiohttp.ClientSession() as session:
-        for subreddit_name in settings.REDDIT_CHANNELS:
-            try:
-                logger.info(f"Processing subreddit: {subreddit_name}")
-                subreddit = await reddit.subreddit(subreddit_name)
-                posts_processed = 0
-
-                async for post in subreddit.new(limit=settings.REDDIT_POST_LIMIT):
-                    posts_processed += 1
-                    logger.debug(f"Checking post {posts_processed}: {post.title}")
-
-                    if any(keyword in post.title.lower() for keyword in keywords):
-                        logger.info(f"Found matching post: {post.title}")
-                        # Fetch the content
-                        content = await get_post_content(post, session)
-                        date_str = post.created_utc
-
-                        if date_str:
-                            try:
-                                # Try to parse and format the date consistently
-                                parsed_date = datetime.fromtimestamp(
-                                    date_str, tz=timezone.utc
-                                )
-                                date_str = parsed_date.strftime("%Y-%m-%d %H:%M:%S UTC")
-                            except (ValueError, AttributeError):
-                                logger.debug(f"Could not parse date: {date_str}")
-
-                        if content:
-                            logger.info(
-                                f"Successfully collected content for post: {post.title}"
-                            )
-                        else:
-                            logger.warning(
-                                f"No content collected for matching post: {post.title}"
-                            )
-
-                        items.append(
-                            ContentItem(
-                                source=f"reddit/{subreddit_name}",
-                                title=post.title,
-                                url=f"https://reddit.com{post.permalink}",
-                                date=date_str,
-                                content=content,
-                            )
-                        )
-                        logger.debug(
-                            f"Added item to collection. Current total: {len(items)}"
-                        )
-
-                logger.info(
-                    f"Finished processing {posts_processed} posts from r/{subreddit_name}"
+    channels = settings.REDDIT_CHANNELS
+    post_limit = settings.REDDIT_POST_LIMIT
+    logger.info(f"Searching for keywords: {settings.KEYWORDS}")
+    logger.info(f"Searching in subreddits: {channels}")
+
+    semaphore = asyncio.Semaphore(settings.REDDIT_FETCH_CONCURRENCY)
+
+    async def fetch(post):
+        async with semaphore:
+            return post, await get_post_content(post, session)
+
+    for subreddit_name in channels:
+        try:
+            logger.info(f"Processing subreddit: {subreddit_name}")
+            subreddit = await reddit.subreddit(subreddit_name)
+            posts_processed = 0
+            matching_posts = []
+
+            async for post in subreddit.new(limit=post_limit):
+                posts_processed += 1
+                logger.debug("Checking post %d: %s", posts_processed, post.title)
+
+                if find_keyword(post.title):
+                    logger.info(f"Found matching post: {post.title}")
+                    matching_posts.append(post)
+
+            # Posts processed in an earlier run would be dropped as duplicates,
+            # so don't download their linked pages again
+            if settings.SEEN_URLS_PATH and matching_posts:
+                with SeenUrlStore(settings.SEEN_URLS_PATH) as seen_store:
+                    seen_urls = seen_store.seen(
+                        f"https://reddit.com{post.permalink}" for post in matching_posts
+                    )
+                if seen_urls:
+                    logger.debug("Skipping %d already processed posts", len(seen_urls))
+                    matching_posts = [
+                        post
+                        for post in matching_posts
+                        if f"https://reddit.com{post.permalink}" not in seen_urls
+                    ]
+
+            # Fetch the content of all matching posts concurrently
+            results = await asyncio.gather(*(fetch(post) for post in matching_posts))
+
+            for post, content in results:
+                date_str = post.created_utc
+
+                if date_str:
+                    try:
+                        # Try to parse and format the date consistently
+                        parsed_date = datetime.fromtimestamp(date_str, tz=timezone.utc)
+                        date_str = parsed_date.strftime("%Y-%m-%d %H:%M:%S UTC")
+                    except (ValueError, AttributeError):
+                        logger.debug("Could not parse date: %s", date_str)
+
+                if content:
+                    logger.info(
+                        f"Successfully collected content for post: {post.title}"
+                    )
+                else:
+                    logger.warning(
+                        f"No content collected for matching post: {post.title}"
+                    )
+
+                items.append(
+                    ContentItem(
+                        source=f"reddit/{subreddit_name}",
+                        title=post.title,
+                        url=f"https://reddit.com{post.permalink}",
+                        date=date_str,
+                        content=content,
+                    )
                 )
+                logger.debug("Added item to collection. Current total: %d", len(items))
+
+            logger.info(
+                f"Finished processing {posts_processed} posts from r/{subreddit_name}"
+            )
 
-            except Exception as e:
-                logger.error(f"Error searching subreddit {subreddit_name}: {str(e)}")
-                continue
+        except Exception as e:
+            logger.error(f"Error searching subreddit {subreddit_name}: {str(e)}")
+            continue
 
     await reddit.close()
     logger.info(f"Collected {len(items)} items from Reddit")
@@ -1,7 +1,10 @@
+import asyncio
 import logging
-from typing import List
-from llama_index.readers.web import RssReader
-from datetime import datetime
+from typing import List, Optional
+from datetime import datetime, timezone
+
+import feedparser
+from aiohttp_client_cache import CachedSession
 
 from ion_cannon.collectors.base import ContentItem
 from ion_cannon.config.settings import settings
@@ -9,44 +12,77 @@ from ion_cannon.config.settings import settings
 logger = logging.getLogger("ion_cannon")
 
 
-async def collect_rss() -> List[ContentItem]:
-    """Collect content from RSS feeds using LlamaIndex."""
-    reader = RssReader()
+async def _fetch_feed(session: CachedSession, url: str) -> bytes:
+    """Download the raw bytes of a feed."""
+    # Revalidate cached copies with ETag/Last-Modified, so an unchanged feed
+    # costs a 304 instead of a full download
+    async with session.get(url, timeout=30, refresh=True) as response:
+        response.raise_for_status()
+        return await response.read()
+
+
+def _format_entry_date(entry) -> Optional[str]:
+    """Format an entry's publication date consistently, if it has one."""
+    parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+    if parsed:
+        # feedparser normalizes parsed dates to UTC
+        parsed_date = datetime(*parsed[:6], tzinfo=timezone.utc)
+        return parsed_date.strftime("%Y-%m-%d %H:%M:%S UTC")
+
+    date_str = entry.get("published") or entry.get("updated")
+    if date_str:
+        # Leave it undated rather than pass on a string nothing downstream parses
+        logger.debug("Could not parse date: %s", date_str)
+    return None
+
+
+def _entry_content(entry) -> str:
+    """Return an entry's full body (content:encoded/Atom), else its summary."""
+    content = entry.get("content")
+    if content and content[0].get("value"):
+        return content[0]["value"]
+    return entry.get("summary", "")
+
+
+async def collect_rss(session: CachedSession) -> List[ContentItem]:
+    """Collect content from RSS feeds using feedparser."""
     items = []
+    semaphore = asyncio.Semaphore(settings.RSS_FETCH_CONCURRENCY)
+
+    async def load_feed(feed_url: str):
+        async with semaphore:
+            raw = await _fetch_feed(session, feed_url)
+        # feedparser is blocking, so parse in a worker thread
+        return await asyncio.to_thread(feedparser.parse, raw)
+
+    results = await asyncio.gather(
+        *(load_feed(feed_url) for feed_url in settings.RSS_FEEDS),
+        return_exceptions=True,
+    )
+
+    for feed_url, feed in zip(settings.RSS_FEEDS, results):
+        if isinstance(feed, Exception):
+            logger.error(f"Error collecting from RSS feed {feed_url}: {str(feed)}")
+            continue
+
+        for entry in feed.entries:
+            url = entry.get("link") or feed_url
+            title = entry.get("title", "")
+            date_str = _format_entry_date(entry)
 
-    for feed_url in settings.RSS_FEEDS:
-        try:
-            documents = reader.load_data(urls=[feed_url])
-            for doc in documents:
-                # Extract metadata properly
-                url = doc.metadata.get("link") or feed_url
-                date_str = doc.metadata.get("date")
-
-                if date_str:
-                    try:
-                        # Try to parse and format the date consistently
-                        parsed_date = datetime.fromisoformat(
-                            date_str.replace("Z", "+00:00")
-                        )
-                        date_str = parsed_date.strftime("%Y-%m-%d %H:%M:%S UTC")
-                    except (ValueError, AttributeError):
-                        logger.debug(f"Could not parse date: {date_str}")
-
-                items.append(
-                    ContentItem(
-                        source="rss",
-                        content=doc.text,
-                        url=url,
-                        title=doc.metadata.get("title", ""),
-                        date=date_str,
-                        metadata=doc.metadata,
-                    )
+            items.append(
+                ContentItem(
+                    source="rss",
+                    content=_entry_content(entry),
+                    url=url,
+                    title=title,
+                    date=date_str,
+                    metadata={"title": title, "link": url, "date": date_str},
                 )
+            )
 
-                logger.debug(f"Collected RSS item: {url}")
+            logger.debug("Collected RSS item: %s", url)
 
-            logger.info(f"Collected {len(documents)} items from {feed_url}")
-        except Exception as e:
-            logger.error(f"Error collecting from RSS feed {feed_url}: {str(e)}")
+        logger.info(f"Collected {len(feed.entries)} items from {feed_url}")
 
     return items
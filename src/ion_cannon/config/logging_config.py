@@ -1,5 +1,10 @@
+import atexit
+import gzip
 import logging
 import logging.config
+from logging.handlers import QueueHandler
+import os
+import shutil
 from pathlib import Path
 
 from rich.logging import RichHandler
@@ -7,6 +12,28 @@ from rich.logging import RichHandler
 from ion_cannon.config.settings import settings
 
 
+class _LocalQueueHandler(QueueHandler):
+    """
+    QueueHandler for a listener in the same process. Records are queued as-is
+    instead of pre-formatted, so exc_info survives and the console handler
+    can still render rich tracebacks.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _gzip_namer(name: str) -> str:
+    return name + ".gz"
+
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    """Compress a rotated log file; runs on the queue listener thread."""
+    with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+
 def setup_logging() -> None:
     """Initialize logging configuration."""
     # Ensure logs directory exists
@@ -38,12 +65,21 @@ def setup_logging() -> None:
                 "maxBytes": 10485760,  # 10MB
                 "backupCount": 5,
                 "encoding": "utf8",
+                # Rotated logs are gzipped
+                ".": {"namer": _gzip_namer, "rotator": _gzip_rotator},
+            },
+            # Hand records to a background thread that owns the real handlers,
+            # so logging from coroutines never blocks the event loop on I/O
+            "queue": {
+                "class": _LocalQueueHandler,
+                "handlers": ["console", "file"],
+                "respect_handler_level": True,
             },
         },
         "loggers": {
             "ion_cannon": {  # Root logger for our package
                 "level": "DEBUG",
-                "handlers": ["console", "file"],
+                "handlers": ["queue"],
                 "propagate": False,
             }
         },
@@ -51,3 +87,9 @@ def setup_logging() -> None:
 
     # Apply configuration
     logging.config.dictConfig(logging_config)
+
+    # Start the queue listener and flush it on exit
+    queue_handler = logging.getHandlerByName("queue")
+    if queue_handler is not None:
+        queue_handler.listener.start()
+        atexit.register(queue_handler.listener.stop)
@@ -36,6 +36,8 @@ class Settings(BaseSettings):
     LLM_CONFIDENCE_THRESHOLD: float = (
         0.9  # Minimum confidence required to consider valid
     )
+    LLM_MAX_CONCURRENCY: int = 4  # Maximum LLM requests in flight at once
+    LLM_VALIDATION_BATCH_SIZE: int = 20  # Items validated per LLM request
 
     # Multi-LLM Configuration
     VALIDATOR1_PROVIDER: str = "ollama"
@@ -49,6 +51,16 @@ class Settings(BaseSettings):
     BASE_DIR: Path = Path("./data")
     OUTPUT_DIR: Path = Path("./data/output")
     LOGS_DIR: Path = Path("./logs")
+    SEEN_URLS_PATH: Optional[Path] = Path(
+        "./data/seen_urls.sqlite"
+    )  # URLs already processed; None to reprocess everything
+
+    # HTTP
+    HTTP_MAX_CONNECTIONS: int = 64  # Connection pool size shared by collectors
+    HTTP_DNS_CACHE_TTL: int = 300  # Seconds to cache DNS lookups
+    HTTP_CACHE_PATH: Path = Path("./data/http_cache.sqlite")
+    HTTP_CACHE_EXPIRE_AFTER: int = 30 * 24 * 3600  # Seconds feeds stay revalidatable
+    FETCH_MAX_BYTES: int = 2 * 1024 * 1024  # Maximum page body read per URL
 
     # Reddit
     REDDIT_CLIENT_ID: str = os.getenv("REDDIT_CLIENT_ID", "")
@@ -57,8 +69,10 @@ class Settings(BaseSettings):
 
     REDDIT_CHANNELS: List[str] = []
     REDDIT_POST_LIMIT: int = 30
+    REDDIT_FETCH_CONCURRENCY: int = 16  # Maximum external URLs fetched at once
 
     # Content Sources
+    RSS_FETCH_CONCURRENCY: int = 16  # Maximum feeds fetched at once
     RSS_FEEDS: List[str] = [
         # "http://export.arxiv.org/api/query?search_query=cs.AI&max_results=10",
         # "http://export.arxiv.org/api/query?search_query=cs.CR&max_results=10",
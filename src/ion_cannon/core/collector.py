@@ -1,23 +1,66 @@
 import asyncio
-import json
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
+import aiohttp
+import orjson
+from aiohttp_client_cache import CachedSession, SQLiteBackend
 from rich.console import Console
 
 from ion_cannon.collectors.base import ContentItem
 from ion_cannon.collectors.rss import collect_rss
 from ion_cannon.collectors.reddit import collect_reddit
 from ion_cannon.config.settings import settings
+from ion_cannon.core.keywords import find_keyword
 from ion_cannon.processors.validator import ContentValidator
 from ion_cannon.processors.summarizer import ContentSummarizer
+from ion_cannon.utils.seen_urls import SeenUrlStore
 
 logger = logging.getLogger(__name__)
 console = Console()
 
 
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str) -> Optional[datetime]:
+    """
+    Parse an RFC 822 or ISO 8601 date string into an aware datetime.
+    Naive dates are assumed to be UTC. Returns None if the format is not recognized.
+    """
+    # Fast path for the format both collectors normalize to,
+    # e.g. "2024-12-09 11:05:09 UTC"
+    if len(date_str) == 23 and date_str.endswith(" UTC"):
+        try:
+            return datetime.fromisoformat(date_str[:19]).replace(tzinfo=timezone.utc)
+        except ValueError:
+            pass
+
+    try:
+        parsed = parsedate_to_datetime(date_str)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(
+                date_str.replace(" UTC", "+00:00").replace("Z", "+00:00")
+            )
+        except ValueError:
+            return None
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _has_validators(response) -> bool:
+    """
+    Only cache responses that can be revalidated; without an ETag or
+    Last-Modified header a refresh would keep serving the cached copy.
+    """
+    return "ETag" in response.headers or "Last-Modified" in response.headers
+
+
 class ContentCollector:
     """Main content collection and processing orchestrator."""
 
@@ -27,6 +70,10 @@ class ContentCollector:
         verbose: bool = False,
     ):
         """Initialize the content collector."""
+        self._sessions: Optional[Tuple[CachedSession, aiohttp.ClientSession]] = None
+        # URLs processed by the last process_content() call, not yet recorded
+        self._pending_seen_urls: List[str] = []
+
         # Early check for configured sources
         if not settings.RSS_FEEDS and not settings.REDDIT_CHANNELS:
             logger.warning(
@@ -53,24 +100,74 @@ class ContentCollector:
         )
         logger.info("Initialized content processors")
 
+    def _create_sessions(self) -> Tuple[CachedSession, aiohttp.ClientSession]:
+        """
+        Create the HTTP sessions shared by all collectors, over one connection
+        pool: a cached session for feeds and a plain one for linked pages.
+        """
+        settings.HTTP_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        connector = aiohttp.TCPConnector(
+            limit=settings.HTTP_MAX_CONNECTIONS,
+            ttl_dns_cache=settings.HTTP_DNS_CACHE_TTL,
+        )
+        feed_session = CachedSession(
+            cache=SQLiteBackend(
+                cache_name=str(settings.HTTP_CACHE_PATH),
+                expire_after=settings.HTTP_CACHE_EXPIRE_AFTER,
+                cache_control=True,
+                filter_fn=_has_validators,
+            ),
+            connector=connector,
+        )
+        # Caching reads whole bodies, which would defeat the capped, HTML-only
+        # page reads, and linked pages are rarely requested twice anyway
+        page_session = aiohttp.ClientSession(connector=connector, connector_owner=False)
+        return feed_session, page_session
+
+    @staticmethod
+    async def _close_sessions(
+        sessions: Tuple[CachedSession, aiohttp.ClientSession]
+    ) -> None:
+        """Close the page session before the feed session that owns the pool."""
+        feed_session, page_session = sessions
+        await page_session.close()
+        await feed_session.close()
+
+    async def __aenter__(self) -> "ContentCollector":
+        self._sessions = self._create_sessions()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if self._sessions is not None:
+            await self._close_sessions(self._sessions)
+            self._sessions = None
+
     async def collect(self) -> List[ContentItem]:
         """Collect content from all sources."""
         if not self.has_sources:
             logger.warning("No sources configured.")
             return []
 
-        collectors = []
+        # Reuse the collector's sessions if running as a context manager
+        sessions = self._sessions or self._create_sessions()
+        feed_session, page_session = sessions
+        try:
+            collectors = []
 
-        # Only add collectors for configured sources
-        if settings.RSS_FEEDS:
-            collectors.append(collect_rss())
-        if settings.REDDIT_CHANNELS:
-            collectors.append(collect_reddit())
+            # Only add collectors for configured sources
+            if settings.RSS_FEEDS:
+                collectors.append(collect_rss(feed_session))
+            if settings.REDDIT_CHANNELS:
+                collectors.append(collect_reddit(page_session))
 
-        if not collectors:
-            return []
+            if not collectors:
+                return []
+
+            results = await asyncio.gather(*collectors, return_exceptions=True)
+        finally:
+            if sessions is not self._sessions:
+                await self._close_sessions(sessions)
 
-        results = await asyncio.gather(*collectors, return_exceptions=True)
         all_content: List[ContentItem] = []
 
         for source, result in zip(["RSS", "Web"], results):
@@ -93,50 +190,34 @@ class ContentCollector:
             logger.warning("No keywords configured, passing all content through")
             return True
 
-        content_lower = (item.content or "").lower()
-        title_lower = (item.title or "").lower()
+        # Check the (short) title before scanning the full content
+        keyword = find_keyword(item.title) or find_keyword(item.content)
 
-        # Check both title and content for keywords
-        for keyword in settings.KEYWORDS:
-            keyword_lower = keyword.lower()
-            if keyword_lower in content_lower or keyword_lower in title_lower:
-                if self.verbose:
-                    logger.debug(f"Keyword '{keyword}' matched in item: {item.url}")
-                return True
+        if keyword is not None:
+            if self.verbose:
+                logger.debug("Keyword '%s' matched in item: %s", keyword, item.url)
+            return True
 
         if self.verbose:
-            logger.debug(f"No keywords matched for item: {item.url}")
+            logger.debug("No keywords matched for item: %s", item.url)
         return False
 
-    def _is_older_than_10_days(self, date_str: str) -> bool:
+    def _is_older_than_10_days(
+        self, date_str: str, cutoff: Optional[datetime] = None
+    ) -> bool:
         """
         Check if the given date string is older than 10 days from the current date.
         """
         if not date_str:
             return False  # Consider None or empty dates as not older than 10 days
 
-        date_formats = [
-            "%a, %d %b %Y %H:%M:%S %z",  # Example: Mon, 16 Sep 2024 09:00:00 +0000
-            "%a, %d %b %y %H:%M:%S %z",  # Example: Tue, 14 Jan 25 12:00:00 +0000
-            "%a, %d %b %Y %H:%M:%S GMT",  # Example: Wed, 28 Aug 2024 04:30:00 GMT
-            "%a, %d %b %Y %H:%M:%S UTC",  # Example: Wed, 27 Nov 2024 14:00:00 UTC
-            "%Y-%m-%d %H:%M:%S %Z",  # Example: 2024-12-09 11:05:09 UTC
-            "%Y-%m-%d",  # Example: 2024-12-09
-        ]
-
-        for date_format in date_formats:
-            try:
-                item_date = datetime.strptime(date_str, date_format)
-                if item_date.tzinfo is not None:
-                    item_date = item_date.replace(tzinfo=None)
-                break
-            except ValueError:
-                continue
-        else:
+        item_date = _parse_date(date_str)
+        if item_date is None:
             raise ValueError(f"Date format for '{date_str}' not recognized")
 
-        current_date = datetime.now()
-        return (current_date - item_date).days > 10
+        if cutoff is None:
+            cutoff = datetime.now(timezone.utc) - timedelta(days=10)
+        return item_date < cutoff
 
     async def process_content(
         self,
@@ -157,6 +238,7 @@ class ContentCollector:
         keyword_filtered = 0
         llm_rejected = 0
         date_filtered = 0
+        duplicate_filtered = 0
 
         # First, filter by keywords
         keyword_matches = []
@@ -166,57 +248,119 @@ class ContentCollector:
             else:
                 keyword_filtered += 1
                 if self.verbose:
-                    logger.debug(f"Filtered out by keywords: {item.title}")
+                    logger.debug("Filtered out by keywords: %s", item.title)
 
         logger.info(
             f"After keyword filtering: {len(keyword_matches)} items remain ({keyword_filtered} filtered out)"
         )
 
         # Filter out items older than 10 days
+        cutoff = datetime.now(timezone.utc) - timedelta(days=10)
         recent_items = []
         for item in keyword_matches:
-            if not self._is_older_than_10_days(item.date):
+            if not self._is_older_than_10_days(item.date, cutoff):
                 recent_items.append(item)
             else:
                 date_filtered += 1
                 if self.verbose:
-                    logger.debug(f"Filtered out by date: {item.title}")
+                    logger.debug("Filtered out by date: %s", item.title)
 
         logger.info(
             f"After date filtering: {len(recent_items)} items remain ({date_filtered} filtered out)"
         )
 
-        # Then process remaining items with LLM
+        # Drop duplicate URLs and URLs already processed in an earlier run
+        seen_urls = set()
+        if settings.SEEN_URLS_PATH:
+            with SeenUrlStore(settings.SEEN_URLS_PATH) as seen_store:
+                seen_urls = seen_store.seen(item.url for item in recent_items)
+        unique_items = []
         for item in recent_items:
-            try:
-                # Validate with LLM
-                validation_result = await self.validator.process(item)
-
-                # Only summarize if content is relevant
-                if validation_result["is_relevant"]:
-                    summary = await self.summarizer.process(item)
-                    processed_item = {
-                        "url": item.url,
-                        "title": item.title or summary.get("title", "Untitled"),
-                        "source": item.source,
-                        "date": item.date,
-                        **summary,
-                    }
-                    processed_items.append(processed_item)
-                else:
-                    llm_rejected += 1
-                    if self.verbose:
-                        logger.debug(f"Rejected by LLM: {item.url}")
-
-            except Exception as e:
-                logger.error(f"Error processing item {item.url}: {str(e)}")
+            if item.url in seen_urls:
+                duplicate_filtered += 1
+                if self.verbose:
+                    logger.debug("Filtered out as already seen: %s", item.url)
+            else:
+                seen_urls.add(item.url)
+                unique_items.append(item)
+        recent_items = unique_items
+
+        logger.info(
+            f"After duplicate filtering: {len(recent_items)} items remain ({duplicate_filtered} filtered out)"
+        )
+
+        # Then process remaining items with LLM. Validation sends items to the
+        # LLM in batches; the processors bound the number of requests in flight.
+        batch_size = settings.LLM_VALIDATION_BATCH_SIZE
+
+        async def summarize(item: ContentItem, validation_result: Dict):
+            # Only summarize if content is relevant
+            if not validation_result["is_relevant"]:
+                return validation_result, None
+            return validation_result, await self.summarizer.process(item)
+
+        batches = [
+            recent_items[start : start + batch_size]
+            for start in range(0, len(recent_items), batch_size)
+        ]
+        validation_batches = await asyncio.gather(
+            *(self.validator.process_batch(batch) for batch in batches),
+            return_exceptions=True,
+        )
+
+        validated = []
+        for batch, batch_results in zip(batches, validation_batches):
+            if isinstance(batch_results, Exception):
+                logger.error(f"Error validating batch: {str(batch_results)}")
                 continue
+            validated.extend(zip(batch, batch_results))
+
+        results = await asyncio.gather(
+            *(summarize(item, result) for item, result in validated),
+            return_exceptions=True,
+        )
+
+        validated_urls = []
+        for (item, _), result in zip(validated, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error processing item {item.url}: {str(result)}")
+                continue
+
+            validation_result, summary = result
+            validation_failed = validation_result.get("validation_status") in (
+                "error",
+                "skipped",
+            )
+            summary_failed = (
+                summary is not None and summary.get("summarization_status") == "error"
+            )
+            # Items that failed validation or summarization are retried next run
+            if not (validation_failed or summary_failed):
+                validated_urls.append(item.url)
+
+            if summary is not None:
+                processed_item = {
+                    "url": item.url,
+                    "title": item.title or summary.get("title", "Untitled"),
+                    "source": item.source,
+                    "date": item.date,
+                    **summary,
+                }
+                processed_items.append(processed_item)
+            else:
+                llm_rejected += 1
+                if self.verbose:
+                    logger.debug("Rejected by LLM: %s", item.url)
+
+        # Recorded by record_seen_urls() once the results are saved
+        self._pending_seen_urls = validated_urls
 
         # Log final statistics
         logger.info("Content processing summary:")
         logger.info(f"- Total items: {total_items}")
         logger.info(f"- Filtered by keywords: {keyword_filtered}")
         logger.info(f"- Filtered by date: {date_filtered}")
+        logger.info(f"- Filtered as duplicates: {duplicate_filtered}")
         logger.info(f"- Sent to LLM: {len(recent_items)}")
         logger.info(f"- Rejected by LLM: {llm_rejected}")
         logger.info(f"- Accepted items: {len(processed_items)}")
@@ -239,8 +383,7 @@ class ContentCollector:
 
         # Save JSON
         json_file = output_dir / f"collected_content_{timestamp}.json"
-        with open(json_file, "w", encoding="utf-8") as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        json_file.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
 
         # Save formatted report
         report_file = output_dir / f"report_{timestamp}.md"
@@ -248,6 +391,16 @@ class ContentCollector:
 
         logger.info(f"Saved {len(results)} results to {output_dir}")
 
+    def record_seen_urls(self) -> None:
+        """
+        Remember the URLs processed by the last process_content() call so later
+        runs skip them. Call only after the results have been saved.
+        """
+        if settings.SEEN_URLS_PATH and self._pending_seen_urls:
+            with SeenUrlStore(settings.SEEN_URLS_PATH) as seen_store:
+                seen_store.add(self._pending_seen_urls)
+        self._pending_seen_urls = []
+
     def _generate_report(self, results: List[Dict], report_file: Path):
         """Generate a formatted markdown report."""
         report_template = """# Content Collection Report
@@ -261,7 +414,6 @@ Generated: {timestamp}
 
 ## Contents
 
-{items}
 """
         item_template = """### {title}
 
@@ -276,6 +428,7 @@ Generated: {timestamp}
 {insights}
 
 ---
+
 """
         # Get unique sources
         sources = sorted(set(item.get("source", "unknown") for item in results))
@@ -292,10 +445,17 @@ Generated: {timestamp}
         else:
             period = ""
 
-        # Format individual items
-        formatted_items = []
+        # Build the report as a list of parts and write it in one go
+        parts = [
+            report_template.format(
+                timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                total_items=len(results),
+                sources=", ".join(sources),
+                collection_period=period,
+            )
+        ]
         for item in results:
-            formatted_items.append(
+            parts.append(
                 item_template.format(
                     title=item.get("title", "Untitled"),
                     source=item.get("source", "Unknown"),
@@ -306,15 +466,6 @@ Generated: {timestamp}
                 )
             )
 
-        # Generate final report
-        report_content = report_template.format(
-            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            total_items=len(results),
-            sources=", ".join(sources),
-            collection_period=period,
-            items="\n".join(formatted_items),
-        )
-
         # Save report
         with open(report_file, "w", encoding="utf-8") as f:
-            f.write(report_content)
+            f.write("".join(parts))
@@ -0,0 +1,62 @@
+# src/ion_cannon/core/keywords.py
+import re
+from functools import lru_cache
+from typing import Optional, Tuple
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+from ion_cannon.config.settings import settings
+
+
+@lru_cache(maxsize=8)
+def _compile_keywords(keywords: Tuple[str, ...]):
+    """
+    Build a multi-pattern matcher for the given keywords: an Aho-Corasick
+    automaton when pyahocorasick is installed, otherwise a compiled regex.
+    """
+    keywords = tuple(keyword.lower() for keyword in keywords)
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+
+    return re.compile(
+        "|".join(map(re.escape, sorted(keywords, key=len, reverse=True))),
+        re.IGNORECASE,
+    )
+
+
+# Matcher for the keyword list it was built from; rebuilt only when
+# settings.KEYWORDS is replaced, so lookups don't re-hash the list each call
+_matcher = None
+_matcher_keywords = None
+
+
+def _keyword_automaton():
+    """Return the matcher for the configured keywords, building it on first use."""
+    global _matcher, _matcher_keywords
+    keywords = settings.KEYWORDS
+    if keywords is not _matcher_keywords:
+        _matcher = _compile_keywords(tuple(keywords))
+        _matcher_keywords = keywords
+    return _matcher
+
+
+def find_keyword(text: Optional[str]) -> Optional[str]:
+    """Return the first configured keyword found in text, if any."""
+    if not text or not settings.KEYWORDS:
+        return None
+
+    matcher = _keyword_automaton()
+    if isinstance(matcher, re.Pattern):
+        match = matcher.search(text)
+        return match.group(0) if match else None
+
+    # The automaton only matches lowercased input
+    match = next(matcher.iter(text.lower()), None)
+    return match[1] if match else None
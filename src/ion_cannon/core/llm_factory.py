@@ -1,16 +1,78 @@
 # src/ion_cannon/core/llm_factory.py
 import logging
-from typing import Optional, Tuple
+import threading
+from typing import Any, Dict, Optional, Tuple
 
+import httpx
+import msgspec
 from llama_index.core import Settings
 from llama_index.core.llms import LLM
-from llama_index.llms.openai import OpenAI
-from llama_index.llms.ollama import Ollama
 
 from ion_cannon.config.settings import settings
+from ion_cannon.processors.base import Summary, ValidationBatch
 
 logger = logging.getLogger("ion_cannon")
 
+# One keep-alive connection pool shared by every OpenAI client, so requests
+# reuse TCP/TLS connections instead of paying a handshake each time. Created
+# on first use so commands that never build an LLM don't pay for it.
+_http_client: Optional[httpx.AsyncClient] = None
+
+# Response schema for each LLM purpose, enforced by providers that support it
+_RESPONSE_TYPES: Dict[str, type] = {
+    "validator": ValidationBatch,
+    "summarizer": Summary,
+}
+
+# LLM instances already created, keyed by their configuration
+_llm_cache: Dict[Tuple, LLM] = {}
+_llm_cache_lock = threading.Lock()
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=40,
+                max_connections=100,
+                keepalive_expiry=30.0,
+            ),
+            timeout=httpx.Timeout(300.0, connect=10.0),
+        )
+    return _http_client
+
+
+def _response_format(response_type: type) -> Dict[str, Any]:
+    """
+    Build a strict OpenAI json_schema response format from a msgspec Struct.
+    Strict mode requires every property and forbids extra ones and defaults,
+    so the Struct defaults only apply when decoding other providers' output.
+    """
+    _, components = msgspec.json.schema_components(
+        [response_type], ref_template="#/$defs/{name}"
+    )
+    for component in components.values():
+        properties = component.get("properties", {})
+        for prop in properties.values():
+            prop.pop("default", None)
+        component["required"] = list(properties)
+        component["additionalProperties"] = False
+
+    schema = components.pop(response_type.__name__)
+    if components:
+        schema["$defs"] = components
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": response_type.__name__,
+            "schema": schema,
+            "strict": True,
+        },
+    }
+
 
 class LLMFactory:
     """Factory class for creating LLM instances."""
@@ -20,53 +82,92 @@ class LLMFactory:
         provider: Optional[str] = None,
         model: Optional[str] = None,
         require_llm: bool = True,
+        purpose: Optional[str] = None,
     ) -> Optional[LLM]:
-        """Create and return an LLM instance based on provided settings or config."""
+        """
+        Create and return an LLM instance based on provided settings or config.
+        A purpose ("validator" or "summarizer") constrains responses to its schema.
+        """
         provider = provider or settings.LLM_PROVIDER
         model = model or settings.LLM_MODEL
 
-        try:
-            if provider.lower() == "openai":
-                if not settings.OPENAI_API_KEY:
-                    msg = "OpenAI API key not found in environment"
+        cache_key = (
+            provider.lower(),
+            model,
+            settings.LLM_MAX_TOKENS_RESPONSE,
+            settings.LLM_TEMPERATURE,
+            purpose,
+        )
+        with _llm_cache_lock:
+            if cache_key in _llm_cache:
+                llm = _llm_cache[cache_key]
+                Settings.llm = llm
+                return llm
+
+            try:
+                if provider.lower() == "openai":
+                    # Provider stacks are imported on first use to keep CLI
+                    # commands that never create an LLM fast to start
+                    from llama_index.llms.openai import OpenAI
+
+                    if not settings.OPENAI_API_KEY:
+                        msg = "OpenAI API key not found in environment"
+                        if require_llm:
+                            raise ValueError(msg)
+                        logger.warning(msg)
+                        return None
+
+                    additional_kwargs: Dict[str, Any] = {
+                        # Lets OpenAI reuse its cache of our static prompt prefixes.
+                        # Sent as extra_body since older SDKs lack the parameter
+                        "extra_body": {
+                            "prompt_cache_key": f"ion_cannon_{purpose or 'default'}_v1"
+                        }
+                    }
+                    if purpose in _RESPONSE_TYPES:
+                        additional_kwargs["response_format"] = _response_format(
+                            _RESPONSE_TYPES[purpose]
+                        )
+
+                    llm = OpenAI(
+                        api_key=settings.OPENAI_API_KEY,
+                        model=model,
+                        max_tokens=settings.LLM_MAX_TOKENS_RESPONSE,
+                        temperature=settings.LLM_TEMPERATURE,
+                        json_mode=True,
+                        async_http_client=_get_http_client(),
+                        additional_kwargs=additional_kwargs,
+                    )
+                    Settings.llm = llm
+                    _llm_cache[cache_key] = llm
+                    return llm
+
+                elif provider.lower() == "ollama":
+                    from llama_index.llms.ollama import Ollama
+
+                    llm = Ollama(
+                        model=model,
+                        temperature=settings.LLM_TEMPERATURE,
+                        json_mode=True,
+                    )
+                    Settings.llm = llm
+                    _llm_cache[cache_key] = llm
+                    return llm
+
+                else:
+                    msg = f"Unsupported LLM provider: {provider}"
                     if require_llm:
                         raise ValueError(msg)
                     logger.warning(msg)
                     return None
 
-                llm = OpenAI(
-                    api_key=settings.OPENAI_API_KEY,
-                    model=model,
-                    max_tokens=settings.LLM_MAX_TOKENS_RESPONSE,
-                    temperature=settings.LLM_TEMPERATURE,
-                    json_mode=True,
-                )
-                Settings.llm = llm
-                return llm
-
-            elif provider.lower() == "ollama":
-                llm = Ollama(
-                    model=model,
-                    temperature=settings.LLM_TEMPERATURE,
-                    json_mode=True,
-                )
-                Settings.llm = llm
-                return llm
-
-            else:
-                msg = f"Unsupported LLM provider: {provider}"
+            except Exception as e:
+                msg = f"Failed to create LLM instance: {str(e)}"
                 if require_llm:
-                    raise ValueError(msg)
+                    raise ValueError(msg) from e
                 logger.warning(msg)
                 return None
 
-        except Exception as e:
-            msg = f"Failed to create LLM instance: {str(e)}"
-            if require_llm:
-                raise ValueError(msg) from e
-            logger.warning(msg)
-            return None
-
     @staticmethod
     def create_validation_llms(
         require_both: bool = True,
@@ -76,12 +177,14 @@ class LLMFactory:
             provider=settings.VALIDATOR1_PROVIDER,
             model=settings.VALIDATOR1_MODEL,
             require_llm=require_both,
+            purpose="validator",
         )
 
         validator2 = LLMFactory.create_llm(
             provider=settings.VALIDATOR2_PROVIDER,
             model=settings.VALIDATOR2_MODEL,
             require_llm=require_both,
+            purpose="validator",
         )
 
         return validator1, validator2
@@ -93,4 +196,18 @@ class LLMFactory:
             provider=settings.SUMMARIZER_PROVIDER,
             model=settings.SUMMARIZER_MODEL,
             require_llm=required,
+            purpose="summarizer",
         )
+
+    @staticmethod
+    async def aclose() -> None:
+        """
+        Close the shared HTTP connection pool and forget the LLM instances
+        bound to it, so later create_llm() calls start fresh.
+        """
+        global _http_client
+        with _llm_cache_lock:
+            client, _http_client = _http_client, None
+            _llm_cache.clear()
+        if client is not None:
+            await client.aclose()
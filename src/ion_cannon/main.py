@@ -8,9 +8,15 @@ import typer
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, TaskID
 
+try:
+    import uvloop
+except ImportError:  # Not available on Windows
+    uvloop = None
+
 from ion_cannon.config.settings import settings
 from ion_cannon.config.logging_config import setup_logging
 from ion_cannon.core.collector import ContentCollector
+from ion_cannon.core.llm_factory import LLMFactory
 
 # Initialize logging first
 setup_logging()
@@ -65,6 +71,7 @@ async def run_collection(
         if not results:
             logger.warning("No relevant content found after processing")
             console.print("[yellow]No relevant content found after processing.")
+            collector.record_seen_urls()
             return
 
         progress.advance(overall_task)
@@ -77,6 +84,7 @@ async def run_collection(
 
         progress.update(overall_task, description="Saving results...")
         collector.save_results(results)
+        collector.record_seen_urls()
         progress.advance(overall_task)
 
     logger.info("Collection pipeline completed")
@@ -106,7 +114,13 @@ def collect(
     """Collect and analyze content from configured sources."""
     try:
         logger.info(f"Starting collection (multi_llm={multi_llm}, verbose={verbose})")
-        asyncio.run(run_collection(multi_llm, output, verbose))
+        # Run on uvloop's libuv-based event loop when it is installed
+        loop_factory = uvloop.new_event_loop if uvloop is not None else None
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            try:
+                runner.run(run_collection(multi_llm, output, verbose))
+            finally:
+                runner.run(LLMFactory.aclose())
     except KeyboardInterrupt:
         logger.warning("Collection interrupted by user")
         console.print("\n[yellow]Collection interrupted by user")
@@ -1,29 +1,52 @@
+import asyncio
 from abc import ABC, abstractmethod
+from contextlib import aclosing
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+import msgspec
+from llama_index.core.llms import LLM, CompletionResponse
 
 from ion_cannon.collectors.base import ContentItem
+from ion_cannon.config.settings import settings
 
+# Shared by all processors, so the limit applies to LLM requests in flight
+# regardless of how callers batch or fan out their work
+_llm_semaphore = asyncio.Semaphore(settings.LLM_MAX_CONCURRENCY)
 
-class ValidationResult(BaseModel):
+
+class ValidationResult(msgspec.Struct):
     """Model for content validation results."""
 
-    is_relevant: bool = Field(..., description="Whether the content is relevant")
-    confidence: float = Field(..., ge=0, le=1, description="Confidence score")
-    primary_topic: str = Field(..., description="Main topic identified")
-    reason: str = Field(..., description="Explanation for the decision")
-    key_aspects: List[str] = Field(
-        default_factory=list, description="Key aspects identified"
-    )
+    is_relevant: bool  # Whether the content is relevant
+    primary_topic: str  # Main topic identified
+    reason: str  # Explanation for the decision
+    confidence: float = 0.9  # Confidence score, clamped to 0-1
+    key_aspects: Optional[List[str]] = []  # Key aspects identified; null means none
+
+    def __post_init__(self) -> None:
+        self.confidence = max(0.0, min(1.0, self.confidence))
+        if self.key_aspects is None:
+            self.key_aspects = []
+
+
+class BatchValidationResult(ValidationResult, kw_only=True):
+    """Validation result for one item of a batch request."""
+
+    id: int  # 1-based number of the item in the batch prompt
+
 
+class ValidationBatch(msgspec.Struct):
+    """Model for batch validation responses."""
 
-class Summary(BaseModel):
+    results: List[BatchValidationResult]
+
+
+class Summary(msgspec.Struct):
     """Model for content summaries."""
 
-    title: str = Field(..., description="Content title")
-    summary: str = Field(..., description="Brief summary")
-    insight_take: str = Field(..., description="Key insights")
+    title: str  # Content title
+    summary: str  # Brief summary
+    insight_take: str  # Key insights
 
 
 class BaseProcessor(ABC):
@@ -41,3 +64,26 @@ class BaseProcessor(ABC):
             Processing result
         """
         pass
+
+    async def _acomplete(self, llm: LLM, prompt: str) -> CompletionResponse:
+        """Run an LLM completion, bounded by LLM_MAX_CONCURRENCY."""
+        async with _llm_semaphore:
+            return await llm.acomplete(prompt)
+
+    async def _astream_json(self, llm: LLM, prompt: str) -> str:
+        """
+        Stream an LLM completion, bounded by LLM_MAX_CONCURRENCY, and return
+        as soon as the text holds a complete JSON object.
+        """
+        text = ""
+        async with _llm_semaphore:
+            stream = await llm.astream_complete(prompt)
+            # Closing the stream early stops the rest of the generation
+            async with aclosing(stream):
+                async for chunk in stream:
+                    text += chunk.delta or ""
+                    # Balanced braces mean the closing brace has arrived
+                    if text.rstrip().endswith("}"):
+                        if text.count("{") == text.count("}"):
+                            break
+        return text
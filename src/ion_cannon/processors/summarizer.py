@@ -1,12 +1,14 @@
 # src/ion_cannon/processors/summarizer.py
-import json
 import logging
 from typing import Dict, Optional
 
+import msgspec
+from llama_index.core.llms import LLM
+
 from ion_cannon.config import settings
 from ion_cannon.collectors.base import ContentItem
 from ion_cannon.core.llm_factory import LLMFactory
-from ion_cannon.processors.base import BaseProcessor
+from ion_cannon.processors.base import BaseProcessor, Summary
 
 logger = logging.getLogger(__name__)
 
@@ -14,18 +16,21 @@ logger = logging.getLogger(__name__)
 class ContentSummarizer(BaseProcessor):
     """Generates structured summaries of content using LLM."""
 
-    def __init__(self, use_dedicated_llm: bool = False, verbose: bool = False):
+    def __init__(self, use_dedicated_llm: bool = False, verbose: bool = False) -> None:
         self.use_dedicated_llm = use_dedicated_llm
         self.verbose = verbose
+        self.llm: Optional[LLM] = None
         self._setup_llm()
 
-    def _setup_llm(self):
+    def _setup_llm(self) -> None:
         """Initialize summarization LLM."""
         try:
             if self.use_dedicated_llm:
                 self.llm = LLMFactory.create_summarization_llm(required=False)
             else:
-                self.llm = LLMFactory.create_llm(require_llm=False)
+                self.llm = LLMFactory.create_llm(
+                    require_llm=False, purpose="summarizer"
+                )
 
             if self.llm:
                 logger.info("Initialized summarization LLM")
@@ -39,7 +44,7 @@ class ContentSummarizer(BaseProcessor):
     def _get_summary_prompt(self, title: Optional[str], content: str) -> str:
         """Generate the summarization prompt."""
         return settings.SUMMARY_PROMPT_TEMPLATE.format(
-            title=title or "Untitled", content=content[:2500]
+            title=title or "Untitled", content=content
         )
 
     async def process(self, item: ContentItem) -> Dict:
@@ -54,13 +59,14 @@ class ContentSummarizer(BaseProcessor):
             }
 
         try:
-            response = await self.llm.acomplete(
-                self._get_summary_prompt(item.title, item.content)
+            text = await self._astream_json(
+                self.llm, self._get_summary_prompt(item.title, item.summary_excerpt)
             )
-            result = json.loads(response.text.strip())
+            summary = msgspec.json.decode(text.strip(), type=Summary, strict=False)
+            result = msgspec.structs.asdict(summary)
 
-            if self.verbose:
-                logger.debug(f"Generated summary for: {item.url}")
+            if self.verbose and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Generated summary for: %s", item.url)
 
             result["summarization_status"] = "success"
             return result
@@ -1,31 +1,101 @@
 # src/ion_cannon/processors/validator.py
-import json
+import asyncio
 import logging
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from llama_index.core import Settings
+import msgspec
+from llama_index.core.llms import LLM
 
 from ion_cannon.collectors.base import ContentItem
 from ion_cannon.core.llm_factory import LLMFactory
-from ion_cannon.processors.base import BaseProcessor
+from ion_cannon.processors.base import (
+    BaseProcessor,
+    BatchValidationResult,
+    ValidationResult,
+)
 from ion_cannon.config.settings import settings
 
 logger = logging.getLogger("ion_cannon")
 
+# Responses at least this large are decoded off the event loop
+_OFFLOAD_PARSE_BYTES = 64 * 1024
+
+
+class _RawValidationBatch(msgspec.Struct):
+    """ValidationBatch with its verdicts left undecoded."""
+
+    results: List[msgspec.Raw]
+
+
+# Verdicts are decoded one by one so a malformed entry only affects its own
+# item. LLMs sometimes quote numbers and booleans, so decode in lax mode.
+_BATCH_DECODER = msgspec.json.Decoder(_RawValidationBatch)
+_VERDICT_DECODER = msgspec.json.Decoder(BatchValidationResult, strict=False)
+
+_RELEVANCE_CRITERIA = """You are a content relevance analyzer specializing in AI and cybersecurity. Your task is to determine if the provided content specifically discusses the intersection of artificial intelligence/LLMs and cybersecurity.
+
+Examples of RELEVANT content:
+- Using AI/LLMs to detect security vulnerabilities
+- AI-powered malware or attack vectors
+- Protecting LLM systems from attacks/prompt injection
+- AI/LLM security research findings
+- Machine learning models being used in security tools
+- Security implications of AI systems
+- AI-based threat detection and response
+- Adversarial attacks against AI systems
+- Securing AI/ML pipelines
+- AI/LLM security best practices
+
+Examples of NOT RELEVANT content:
+- General cybersecurity news without AI/LLM focus
+- Basic AI/ML news without security aspects
+- Traditional malware analysis
+- Regular vulnerability reports
+- Standard security tool updates
+- General IT security practices
+- Basic network security
+- Traditional threat intelligence
+- Regular data breaches without AI aspects
+- General privacy issues without AI connection"""
+
+_RELEVANCE_RULE = """Only mark content as relevant if it substantively discusses the intersection of AI/LLM technology and security. If it merely mentions AI in passing while discussing general security, mark it as not relevant."""
+
+# Static prompt prefix, built once so every request shares an identical prefix
+_BATCH_PROMPT_PREFIX = f"""{_RELEVANCE_CRITERIA}
+
+Analyze each of the numbered content items below and return a JSON object with a "results" list containing one entry per item:
+{{
+    "results": [
+        {{
+            "id": integer (the item number),
+            "is_relevant": boolean,
+            "confidence": float (0-1),
+            "primary_topic": string (main AI security topic discussed),
+            "reason": string (brief explanation of decision),
+            "key_aspects": [list of specific AI/LLM security elements mentioned]
+        }}
+    ]
+}}
+
+{_RELEVANCE_RULE}
+
+Content items to analyze:
+"""
+
 
 class ContentValidator(BaseProcessor):
     """Validates content relevance using LLM(s)."""
 
-    def __init__(self, use_multi_llm: bool = False, verbose: bool = False):
+    def __init__(self, use_multi_llm: bool = False, verbose: bool = False) -> None:
         self.use_multi_llm = use_multi_llm
         self.verbose = verbose
         # Initialize all instance variables
-        self.validator1 = None
-        self.validator2 = None
-        self.validator = None
+        self.validator1: Optional[LLM] = None
+        self.validator2: Optional[LLM] = None
+        self.validator: Optional[LLM] = None
         self._setup_llms()
 
-    def _setup_llms(self):
+    def _setup_llms(self) -> None:
         """Initialize LLM(s) for validation."""
         try:
             if self.use_multi_llm:
@@ -45,7 +115,9 @@ class ContentValidator(BaseProcessor):
                         "No validators available, validation will be skipped"
                     )
             else:
-                self.validator = LLMFactory.create_llm(require_llm=False)
+                self.validator = LLMFactory.create_llm(
+                    require_llm=False, purpose="validator"
+                )
                 if self.validator:
                     logger.info("Initialized validation LLM")
                 else:
@@ -58,128 +130,149 @@ class ContentValidator(BaseProcessor):
             self.use_multi_llm = False
 
     async def _safe_llm_completion(
-        self, llm, content: str, validator_name: str = "validator"
-    ) -> Optional[Dict]:
+        self, llm: LLM, item: ContentItem, validator_name: str = "validator"
+    ) -> Optional[ValidationResult]:
         """Safely handle LLM completion and response parsing."""
         # First ensure we have a valid LLM
         if llm is None:
             logger.error(f"{validator_name}: No LLM provided")
             return None
 
-        # Set the LLM in Settings
-        try:
-            Settings.llm = llm
-        except Exception as e:
-            logger.error(f"{validator_name}: Failed to set LLM in Settings: {e}")
-            return None
+        if self.verbose and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "%s: Using content (truncated): %s",
+                validator_name,
+                item.validation_excerpt,
+            )
 
-        # Prepare the content
-        try:
-            formatted_content = content[:200].strip()
-            if self.verbose:
-                logger.debug(
-                    f"{validator_name}: Using content (truncated): {formatted_content}"
-                )
-        except Exception as e:
-            logger.error(f"{validator_name}: Failed to format content: {e}")
+        # Validation LLMs are constrained to the batch response schema, so a
+        # single item is validated as a batch of one
+        results = await self._safe_batch_completion(llm, [item], validator_name)
+        return results[0] if results else None
+
+    @staticmethod
+    async def _decode(decoder: msgspec.json.Decoder, text: str) -> Any:
+        """Decode a JSON response, moving large payloads to the default executor."""
+        if len(text) < _OFFLOAD_PARSE_BYTES:
+            return decoder.decode(text)
+        # No contextvars are needed here, so skip the to_thread() context copy
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, decoder.decode, text)
+
+    async def _safe_batch_completion(
+        self, llm: LLM, items: List[ContentItem], validator_name: str = "validator"
+    ) -> Optional[List[Optional[ValidationResult]]]:
+        """
+        Validate several items with a single LLM request.
+        Returns one result per item (None where the LLM gave no usable verdict),
+        or None if the whole response could not be used.
+        """
+        if llm is None:
+            logger.error(f"{validator_name}: No LLM provided")
             return None
 
-        # Prepare the prompt
-        prompt = f"""You are a content relevance analyzer specializing in AI and cybersecurity. Your task is to determine if the provided content specifically discusses the intersection of artificial intelligence/LLMs and cybersecurity.
-
-Examples of RELEVANT content:
-- Using AI/LLMs to detect security vulnerabilities
-- AI-powered malware or attack vectors
-- Protecting LLM systems from attacks/prompt injection
-- AI/LLM security research findings
-- Machine learning models being used in security tools
-- Security implications of AI systems
-- AI-based threat detection and response
-- Adversarial attacks against AI systems
-- Securing AI/ML pipelines
-- AI/LLM security best practices
-
-Examples of NOT RELEVANT content:
-- General cybersecurity news without AI/LLM focus
-- Basic AI/ML news without security aspects
-- Traditional malware analysis
-- Regular vulnerability reports
-- Standard security tool updates
-- General IT security practices
-- Basic network security
-- Traditional threat intelligence
-- Regular data breaches without AI aspects
-- General privacy issues without AI connection
-
-Analyze the following content and return a JSON object with:
-{{
-    "is_relevant": boolean,
-    "confidence": float (0-1),
-    "primary_topic": string (main AI security topic discussed),
-    "reason": string (brief explanation of decision),
-    "key_aspects": [list of specific AI/LLM security elements mentioned]
-}}
-
-Only mark content as relevant if it substantively discusses the intersection of AI/LLM technology and security. If it merely mentions AI in passing while discussing general security, mark it as not relevant.
-
-Content to analyze:
-{formatted_content}"""
+        numbered_items = "\n\n".join(
+            f"[{index}] {item.validation_excerpt}"
+            for index, item in enumerate(items, start=1)
+        )
+        prompt = _BATCH_PROMPT_PREFIX + numbered_items
 
+        response_text = ""
         try:
-            # Make the LLM call
-            if self.verbose:
-                logger.debug(f"{validator_name}: Sending prompt to LLM")
-            response = await Settings.llm.acomplete(prompt)
+            if self.verbose and logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "%s: Sending batch of %d items to LLM", validator_name, len(items)
+                )
+            response = await self._acomplete(llm, prompt)
 
-            # Check response
             if not response or not hasattr(response, "text"):
-                logger.error(f"{validator_name}: Invalid response from LLM")
+                logger.error(f"{validator_name}: Invalid batch response from LLM")
                 return None
 
-            # Get response text
             response_text = response.text.strip()
-            if self.verbose:
-                logger.debug(f"{validator_name}: Raw LLM response:\n{response_text}")
-
-            # Parse JSON
-            result = json.loads(response_text)
-
-            # Validate and normalize result
-            if not isinstance(result, dict):
-                raise ValueError("Response is not a dictionary")
-
-            result["confidence"] = max(
-                0.0, min(1.0, float(result.get("confidence", 0.9)))
-            )
-            if "key_aspects" not in result:
-                result["key_aspects"] = []
-
-            return result
-
-        except json.JSONDecodeError as e:
+            if self.verbose and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s: Raw LLM response:\n%s", validator_name, response_text)
+
+            batch = await self._decode(_BATCH_DECODER, response_text)
+
+            # Map verdicts back to items by their 1-based id
+            results: List[Optional[ValidationResult]] = [None] * len(items)
+            for raw_verdict in batch.results:
+                try:
+                    verdict = _VERDICT_DECODER.decode(raw_verdict)
+                except msgspec.ValidationError as e:
+                    logger.warning("%s: Invalid verdict: %s", validator_name, e)
+                    continue
+                if 1 <= verdict.id <= len(items):
+                    results[verdict.id - 1] = verdict
+            return results
+
+        except msgspec.DecodeError as e:
             logger.error(f"{validator_name}: JSON parsing error: {str(e)}")
             logger.error(f"{validator_name}: Problematic response:\n{response_text}")
             return None
         except Exception as e:
             logger.error(
-                f"{validator_name}: Unexpected error during LLM completion: {str(e)}"
+                f"{validator_name}: Unexpected error during batch LLM completion: {str(e)}"
             )
             return None
 
-    async def _check_relevance(self, result: Dict) -> bool:
+    def _check_relevance(self, result: ValidationResult) -> bool:
         """
         Check if a result meets our confidence threshold and relevance criteria.
         """
         # First check confidence threshold
-        if result["confidence"] < settings.LLM_CONFIDENCE_THRESHOLD:
-            if self.verbose:
+        if result.confidence < settings.LLM_CONFIDENCE_THRESHOLD:
+            if self.verbose and logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
-                    f"Confidence {result['confidence']} below threshold {settings.LLM_CONFIDENCE_THRESHOLD}"
+                    "Confidence %s below threshold %s",
+                    result.confidence,
+                    settings.LLM_CONFIDENCE_THRESHOLD,
                 )
             return False
 
         # If confidence is good, return the relevance decision
-        return result["is_relevant"]
+        return result.is_relevant
+
+    def _multi_llm_verdict(
+        self, result1: ValidationResult, result2: ValidationResult
+    ) -> Dict:
+        """Combine two validator results into a single verdict."""
+        # Check if both results meet confidence threshold and agree on relevance
+        is_confident_and_relevant = self._check_relevance(
+            result1
+        ) and self._check_relevance(result2)
+
+        return {
+            "is_relevant": is_confident_and_relevant,
+            "confidence": min(result1.confidence, result2.confidence),
+            "primary_topic": result1.primary_topic,
+            "reason": result1.reason
+            if is_confident_and_relevant
+            else f"Confidence threshold not met (scores: {result1.confidence}, {result2.confidence})",
+            "key_aspects": result1.key_aspects if is_confident_and_relevant else [],
+            "validation_status": "multi_llm",
+        }
+
+    def _single_llm_verdict(self, result: ValidationResult) -> Dict:
+        """Turn a single validator result into a verdict."""
+        is_confident_and_relevant = self._check_relevance(result)
+        return {
+            "is_relevant": is_confident_and_relevant,
+            "confidence": result.confidence,
+            "primary_topic": result.primary_topic,
+            "reason": result.reason
+            if is_confident_and_relevant
+            else f"Confidence threshold not met (score: {result.confidence})",
+            "key_aspects": result.key_aspects if is_confident_and_relevant else [],
+            "validation_status": "single_llm",
+        }
+
+    def _primary_rejection_verdict(self, result1: ValidationResult) -> Dict:
+        """Verdict for content validator1 rejected, without consulting validator2."""
+        verdict = self._single_llm_verdict(result1)
+        verdict["validation_status"] = "multi_llm"
+        return verdict
 
     async def process(self, item: ContentItem) -> Dict:
         """Process a content item through validation."""
@@ -199,7 +292,7 @@ Content to analyze:
         try:
             if self.use_multi_llm and self.validator1 and self.validator2:
                 result1 = await self._safe_llm_completion(
-                    self.validator1, item.content, "validator1"
+                    self.validator1, item, "validator1"
                 )
                 if not result1:
                     logger.warning(
@@ -207,49 +300,22 @@ Content to analyze:
                     )
                     self.validator = self.validator1
                     self.use_multi_llm = False
+                elif not self._check_relevance(result1):
+                    # Both validators must agree, so validator2 can't change this
+                    return self._primary_rejection_verdict(result1)
                 else:
                     result2 = await self._safe_llm_completion(
-                        self.validator2, item.content, "validator2"
+                        self.validator2, item, "validator2"
                     )
                     if result2:
-                        # Check if both results meet confidence threshold and agree on relevance
-                        is_confident_and_relevant = await self._check_relevance(
-                            result1
-                        ) and await self._check_relevance(result2)
-
-                        return {
-                            "is_relevant": is_confident_and_relevant,
-                            "confidence": min(
-                                result1["confidence"], result2["confidence"]
-                            ),
-                            "primary_topic": result1["primary_topic"],
-                            "reason": result1["reason"]
-                            if is_confident_and_relevant
-                            else f"Confidence threshold not met (scores: {result1['confidence']}, {result2['confidence']})",
-                            "key_aspects": result1["key_aspects"]
-                            if is_confident_and_relevant
-                            else [],
-                            "validation_status": "multi_llm",
-                        }
+                        return self._multi_llm_verdict(result1, result2)
 
             # Single validator mode (either by choice or fallback)
             validator = self.validator1 if self.use_multi_llm else self.validator
             if validator:
-                result = await self._safe_llm_completion(validator, item.content)
+                result = await self._safe_llm_completion(validator, item)
                 if result:
-                    is_confident_and_relevant = await self._check_relevance(result)
-                    return {
-                        "is_relevant": is_confident_and_relevant,
-                        "confidence": result["confidence"],
-                        "primary_topic": result["primary_topic"],
-                        "reason": result["reason"]
-                        if is_confident_and_relevant
-                        else f"Confidence threshold not met (score: {result['confidence']})",
-                        "key_aspects": result["key_aspects"]
-                        if is_confident_and_relevant
-                        else [],
-                        "validation_status": "single_llm",
-                    }
+                    return self._single_llm_verdict(result)
 
             # If all validation attempts failed
             logger.warning(f"All validation attempts failed for {item.url}")
@@ -268,3 +334,54 @@ Content to analyze:
                 "validation_status": "error",
                 "reason": f"Error: {str(e)}",
             }
+
+    async def process_batch(self, items: List[ContentItem]) -> List[Dict]:
+        """
+        Process several content items through validation with one LLM request
+        per validator. Items without a usable verdict fall back to process().
+        """
+        if not items:
+            return []
+
+        verdicts: List[Optional[Dict]] = [None] * len(items)
+        try:
+            if self.use_multi_llm and self.validator1 and self.validator2:
+                results1 = await self._safe_batch_completion(
+                    self.validator1, items, "validator1"
+                )
+
+                # Only items validator1 accepted need a second opinion
+                accepted: List[Tuple[int, ValidationResult]] = []
+                for index, result1 in enumerate(results1 or []):
+                    if not result1:
+                        continue
+                    if self._check_relevance(result1):
+                        accepted.append((index, result1))
+                    else:
+                        verdicts[index] = self._primary_rejection_verdict(result1)
+
+                if accepted:
+                    results2 = await self._safe_batch_completion(
+                        self.validator2, [items[i] for i, _ in accepted], "validator2"
+                    )
+                    for (index, result1), result2 in zip(accepted, results2 or []):
+                        if result2:
+                            verdicts[index] = self._multi_llm_verdict(result1, result2)
+
+            elif not self.use_multi_llm and self.validator:
+                results = await self._safe_batch_completion(self.validator, items)
+                for index, result in enumerate(results or []):
+                    if result:
+                        verdicts[index] = self._single_llm_verdict(result)
+
+        except Exception as e:
+            logger.error(f"Batch validation failed: {str(e)}")
+
+        # Validate anything the batch couldn't settle one item at a time,
+        # concurrently so the shared LLM semaphore stays busy
+        missing = [index for index, verdict in enumerate(verdicts) if verdict is None]
+        fallbacks = await asyncio.gather(*(self.process(items[i]) for i in missing))
+        for index, verdict in zip(missing, fallbacks):
+            verdicts[index] = verdict
+
+        return [verdict for verdict in verdicts if verdict is not None]
@@ -0,0 +1,51 @@
+# src/ion_cannon/utils/seen_urls.py
+import hashlib
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Set
+
+
+class SeenUrlStore:
+    """Persistent record of URLs already processed by the LLM pipeline."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen_urls ("
+            "url_hash TEXT PRIMARY KEY, url TEXT NOT NULL, seen_at TEXT NOT NULL)"
+        )
+
+    @staticmethod
+    def _hash(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def seen(self, urls: Iterable[str]) -> Set[str]:
+        """Return the subset of urls that were processed in an earlier run."""
+        return {
+            url
+            for url in urls
+            if self._conn.execute(
+                "SELECT 1 FROM seen_urls WHERE url_hash = ?", (self._hash(url),)
+            ).fetchone()
+        }
+
+    def add(self, urls: Iterable[str]) -> None:
+        """Record urls as processed."""
+        seen_at = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO seen_urls (url_hash, url, seen_at) "
+                "VALUES (?, ?, ?)",
+                ((self._hash(url), url, seen_at) for url in urls),
+            )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "SeenUrlStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()